@@ -5,8 +5,11 @@
 # Tweaks: larger company name in top brand bar; assumptions moved to bottom below 3 columns.
 
 import urllib.parse
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 import streamlit as st
 import streamlit.components.v1 as components
 
@@ -20,7 +23,7 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-st.markdown(
+GLOBAL_CSS = (
     """
     <style>
       :root {
@@ -106,45 +109,168 @@ st.markdown(
         .card { break-inside: avoid; }
       }
     </style>
-    """,
-    unsafe_allow_html=True,
+    """
 )
 
 # ---------------------------
 # Helpers & constants
 # ---------------------------
-def clamp(x, lo, hi): return max(lo, min(hi, x))
+@lru_cache(maxsize=256)
 def format_currency(x):
     try: return f"${int(round(x, 0)):,}"
     except Exception: return "$0"
+@lru_cache(maxsize=256)
 def format_hours(x): return f"{x:.1f} h/mo"
 def risk_reduction_label(pct):
     if pct >= 30: return "High"
     elif pct >= 20: return "Moderate"
     else: return "Modest"
+# One complete card per string, so a group of cards can be joined into a single element.
+def kpi_card(label, value=None, subs=(), plan=False):
+    value_html = f'<div class="value">{value}</div>' if value is not None else ""
+    subs_html = "".join(f'<div class="sub">{sub}</div>' for sub in subs)
+    return (f'<div class="card{" plan" if plan else ""}"><div class="kpi">'
+            f'<div class="label">{label}</div>{value_html}{subs_html}</div></div>')
 
-OPS_REDUCTION = {"Minimum": 0.35, "Standard": 0.25, "Advanced": 0.15}
-PHISH_REDUCTION = {"Minimum": 0.30, "Standard": 0.22, "Advanced": 0.15}
-INCIDENTS_DIVISOR = {"Minimum": 120.0, "Standard": 180.0, "Advanced": 260.0}
+# Per-level constants, one row per level: (ops reduction, phishing reduction, incidents divisor)
+LEVEL_IDX = {"Minimum": 0, "Standard": 1, "Advanced": 2}
+LEVEL_PARAMS = (
+    (0.35, 0.30, 120.0),
+    (0.25, 0.22, 180.0),
+    (0.15, 0.15, 260.0),
+)
 LOSS_PER_INCIDENT = 25000.0
 MAX_ANNUAL_INCIDENTS = 8.0
 MIN_ANNUAL_INCIDENTS = 0.2
 
+# Assumptions text (rendered at the bottom of the page, below the three columns)
+ASSUMPTIONS_MD = (
+    f"""
+- **Estimates only.** Results are a directional guide for budgeting and value visualization.
+- **We do not store inputs.** This prototype does not persist your data.
+- **Formulas (prototype-grade):**
+  - Current monthly ops hours = `0.4 × staff + 8 × IT_FTE + 0.03 × devices` (min 12 h).
+  - Workload reduction rate by current level: **Minimum 35%**, **Standard 25%**, **Advanced 15%**.
+  - Phishing incident reduction potential by current level: **Minimum 30%**, **Standard 22%**, **Advanced 15%**.
+  - Annual incidents baseline (pre-solution) = `staff / {{120, 180, 260}}` for levels {{Minimum, Standard, Advanced}}, clamped to **[0.2, 8]**.
+  - **Annual avoided losses** = `baseline incidents × ${int(LOSS_PER_INCIDENT):,} × reduction rate`.
+  - **Affordability cap (monthly)** = `labor savings per month + (annual avoided losses / 12)`.
+- **Plan recommendation heuristic (prototype):** weighs HIPAA need, size, IT coverage, current controls, and device density to suggest **Essential / Standard / Advanced**.
+- **HIPAA/BAA:** Indication is for messaging; full compliance depends on your implementation, agreements, and controls.
+- **Branding:** This is a prototype for **DigitalBunker365.com** and is not a public price quote.
+    """
+)
+
+# "Email me a detailed report" CTA. Subject is constant, so it is quoted once here.
+MAILTO_TO = "contact@digitalbunker365.com"  # change to production alias if needed
+MAILTO_SUBJECT_Q = urllib.parse.quote("ROI Quick Check — Request detailed report")
+MAILTO_BODY_TMPL = (
+    "Hi Digital Bunker 365 team,\n"
+    "\n"
+    "Please send me a detailed ROI report based on my quick check.\n"
+    "\n"
+    "Industry: {industry}\n"
+    "Staff: {staff}, IT FTE: {it_staff}, Devices: {devices}\n"
+    "Current level: {level}, HIPAA: {hipaa}\n"
+    "Monthly workload reduction: {hours_fmt} (≈ {labor_fmt}/mo)\n"
+    "Phishing risk reduction: {phish_pct}%\n"
+    "Annual avoided losses: {avoided_fmt}\n"
+    "Affordability cap (monthly): {cap_fmt}\n"
+    "\n"
+    "Thanks!"
+)
+
+# ROI arithmetic. Numbers in, numbers out (level constants resolved by the caller).
+# Pure Python for the single-submit path; the headcount sweep passes np.maximum /
+# np.minimum so the same formula runs elementwise over arrays.
+def roi_kernel(staff, it_staff, devices, ops_r, phish_r, inc_div, hourly, loss, maximum=max, minimum=min):
+    current_ops = maximum(0.4 * staff + 8.0 * it_staff + 0.03 * devices, 12.0)
+    hours_saved = current_ops * ops_r
+    labor_savings_monthly = hours_saved * max(hourly, 0.0)
+    annual_incidents_baseline = maximum(MIN_ANNUAL_INCIDENTS, minimum(MAX_ANNUAL_INCIDENTS, staff / inc_div))
+    annual_avoided_loss = annual_incidents_baseline * loss * phish_r
+    affordability_cap_monthly = labor_savings_monthly + (annual_avoided_loss / 12.0)
+    return (current_ops, hours_saved, labor_savings_monthly,
+            annual_incidents_baseline, annual_avoided_loss, affordability_cap_monthly)
+
+# roi_kernel() over a whole headcount grid in one vectorized pass (drives the sensitivity chart).
+@st.cache_data(max_entries=64, show_spinner=False)
+def cap_by_headcount(it_staff, level, hourly, devices_per_staff, max_staff=500):
+    ops_r, phish_r, inc_div = LEVEL_PARAMS[LEVEL_IDX[level]]
+    staff = np.arange(1, max_staff + 1, dtype=np.float64)
+    devices = np.round(staff * devices_per_staff)
+    cap = roi_kernel(staff, it_staff, devices, ops_r, phish_r, inc_div, hourly, LOSS_PER_INCIDENT,
+                     maximum=np.maximum, minimum=np.minimum)[-1]
+    return {"Staff": staff.astype(np.int64), "Cap ($/mo)": cap}
+
+# Plan recommendation heuristic as a feature table: (flag, score, reason), in reason order.
+# Tiered factors (size, IT capacity, level) use one flag per tier.
+PLAN_FEATURES = (
+    ("hipaa_yes", 1.0, "Requires HIPAA/BAA"),
+    ("staff_ge_100", 1.0, "100+ staff scale"),
+    ("staff_30_99", 0.5, "30–99 staff scale"),
+    ("it_none", 1.0, "No dedicated IT/Sec FTE"),
+    ("it_limited", 0.5, "Limited IT/Sec capacity"),
+    ("level_minimum", 1.0, "Current controls: Minimum"),
+    ("level_standard", 0.5, "Current controls: Standard"),
+    ("high_density", 0.5, "High device density"),
+)
+PLAN_THRESHOLDS = (1.0, 2.0)  # score < 1 Essential, < 2 Standard, else Advanced
+PLANS = ("Essential", "Standard", "Advanced")
+
+def plan_recommendation(staff, it_staff, level, hipaa, devices):
+    flags = {
+        "hipaa_yes": hipaa == "Yes",
+        "staff_ge_100": staff >= 100,
+        "staff_30_99": 30 <= staff < 100,
+        "it_none": it_staff == 0,
+        "it_limited": 0 < it_staff <= 2,
+        "level_minimum": level == "Minimum",
+        "level_standard": level == "Standard",
+        "high_density": staff > 0 and devices / staff > 1.5,
+    }
+    reasons = [reason for key, _, reason in PLAN_FEATURES if flags[key]]
+    risk_score = sum(score for key, score, _ in PLAN_FEATURES if flags[key])
+    return PLANS[bisect_right(PLAN_THRESHOLDS, risk_score)], reasons
+
+# Pure ROI math for one set of form inputs; memoized so a repeat "Go" is a lookup.
+@st.cache_data(max_entries=256, show_spinner=False)
+def compute_roi(industry, staff, it_staff, level, hipaa, hourly, devices_opt):
+    devices = devices_opt if devices_opt > 0 else int(round(staff * 1.2))
+    ops_r, phish_r, inc_div = LEVEL_PARAMS[LEVEL_IDX[level]]
+    phish_reduction_pct = phish_r * 100
+    (current_ops, hours_saved, labor_savings_monthly,
+     annual_incidents_baseline, annual_avoided_loss, affordability_cap_monthly) = roi_kernel(
+        staff, it_staff, devices, ops_r, phish_r, inc_div, hourly, LOSS_PER_INCIDENT)
+
+    plan, reasons = plan_recommendation(staff, it_staff, level, hipaa, devices)
+
+    return dict(
+        industry=industry, staff=staff, it_staff=it_staff, level=level, hipaa=hipaa,
+        hourly=hourly, devices=devices,
+        current_ops=current_ops, hours_saved=hours_saved,
+        labor_savings_monthly=labor_savings_monthly,
+        phish_reduction_pct=phish_reduction_pct,
+        annual_incidents_baseline=annual_incidents_baseline,
+        annual_avoided_loss=annual_avoided_loss,
+        affordability_cap_monthly=affordability_cap_monthly,
+        plan=plan, reasons=reasons
+    )
+
 # ---------------------------
 # Brand bar & Hero
 # ---------------------------
-st.markdown(
+BRANDBAR_HTML = (
     """
     <div class="brandbar">
       <div><a href="https://www.digitalbunker365.com/" target="_blank" rel="noopener">Digital Bunker 365</a></div>
       <div class="badge">Prototype · ROI Simulator</div>
     </div>
-    """,
-    unsafe_allow_html=True,
+    """
 )
 
 # --- NEW: Sticky info box (purpose & key notes) just under brandbar ---
-st.markdown(
+STICKY_HTML = (
     """
     <div class="sticky-info">
       <strong>Purpose & Key Notes:</strong>
@@ -153,11 +279,10 @@ st.markdown(
       (i.e., if your monthly cost is at or below this cap, ROI stays non-negative).
       <a href="#assumptions">Learn more →</a>
     </div>
-    """,
-    unsafe_allow_html=True,
+    """
 )
 
-st.markdown(
+HERO_HTML = (
     """
     <div class="hero">
       <h1>ROI Quick Check (30 sec)</h1>
@@ -172,10 +297,17 @@ st.markdown(
         <div class="chip">Estimates only</div>
       </div>
     </div>
-    """,
-    unsafe_allow_html=True,
+    """
 )
 
+# Page head, drawn on every run. Don't gate it on a session_state "already injected"
+# flag: Streamlit drops any element a rerun doesn't draw, so the <style> block would
+# vanish after the first Go.
+st.markdown(GLOBAL_CSS, unsafe_allow_html=True)
+st.markdown(BRANDBAR_HTML, unsafe_allow_html=True)
+st.markdown(STICKY_HTML, unsafe_allow_html=True)
+st.markdown(HERO_HTML, unsafe_allow_html=True)
+
 # ---------------------------
 # Inputs (form) — keep current version
 # ---------------------------
@@ -206,42 +338,7 @@ if "roi" not in st.session_state:
 # Compute on submit
 # ---------------------------
 if submitted:
-    devices = devices_opt if devices_opt > 0 else int(round(staff * 1.2))
-    current_ops = max(0.4 * staff + 8.0 * it_staff + 0.03 * devices, 12.0)
-
-    ops_reduction_rate = OPS_REDUCTION[level]
-    phish_reduction_pct = PHISH_REDUCTION[level] * 100
-    hours_saved = current_ops * ops_reduction_rate
-    labor_savings_monthly = hours_saved * max(hourly, 0.0)
-
-    annual_incidents_baseline = clamp(staff / INCIDENTS_DIVISOR[level], MIN_ANNUAL_INCIDENTS, MAX_ANNUAL_INCIDENTS)
-    annual_avoided_loss = annual_incidents_baseline * LOSS_PER_INCIDENT * PHISH_REDUCTION[level]
-    affordability_cap_monthly = labor_savings_monthly + (annual_avoided_loss / 12.0)
-
-    # Plan recommendation heuristic
-    risk_score, reasons = 0.0, []
-    if hipaa == "Yes": risk_score += 1.0; reasons.append("Requires HIPAA/BAA")
-    if staff >= 100: risk_score += 1.0; reasons.append("100+ staff scale")
-    elif staff >= 30: risk_score += 0.5; reasons.append("30–99 staff scale")
-    if it_staff == 0: risk_score += 1.0; reasons.append("No dedicated IT/Sec FTE")
-    elif it_staff <= 2: risk_score += 0.5; reasons.append("Limited IT/Sec capacity")
-    if level == "Minimum": risk_score += 1.0; reasons.append("Current controls: Minimum")
-    elif level == "Standard": risk_score += 0.5; reasons.append("Current controls: Standard")
-    if staff > 0 and (devices / staff) > 1.5: risk_score += 0.5; reasons.append("High device density")
-
-    plan = "Essential" if risk_score < 1.0 else ("Standard" if risk_score < 2.0 else "Advanced")
-
-    st.session_state["roi"] = dict(
-        industry=industry, staff=staff, it_staff=it_staff, level=level, hipaa=hipaa,
-        hourly=hourly, devices=devices,
-        current_ops=current_ops, hours_saved=hours_saved,
-        labor_savings_monthly=labor_savings_monthly,
-        phish_reduction_pct=phish_reduction_pct,
-        annual_incidents_baseline=annual_incidents_baseline,
-        annual_avoided_loss=annual_avoided_loss,
-        affordability_cap_monthly=affordability_cap_monthly,
-        plan=plan, reasons=reasons
-    )
+    st.session_state["roi"] = compute_roi(industry, staff, it_staff, level, hipaa, hourly, devices_opt)
 
 # ---------------------------
 # Three-column layout AFTER Go (Results | Similar orgs | Next steps)
@@ -253,159 +350,94 @@ if roi:
     # ---- Column 1: Your Results ----
     with col_results:
         st.markdown("### Your Results")
-        st.markdown('<div class="kpi-grid-2">', unsafe_allow_html=True)
-
-        st.markdown(
-            f"""
-            <div class="card plan">
-              <div class="kpi">
-                <div class="label">Recommended plan</div>
-                <div class="value">{roi['plan']}</div>
-                <div class="sub">Why: {", ".join(roi['reasons']) if roi['reasons'] else "Balanced needs"}</div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f"""
-            <div class="card">
-              <div class="kpi">
-                <div class="label">Monthly workload reduction</div>
-                <div class="value">{format_hours(roi['hours_saved'])}</div>
-                <div class="sub">≈ {format_currency(roi['labor_savings_monthly'])} / month</div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        reasons = ", ".join(roi['reasons']) if roi['reasons'] else "Balanced needs"
         tone = risk_reduction_label(roi['phish_reduction_pct'])
-        st.markdown(
-            f"""
-            <div class="card">
-              <div class="kpi">
-                <div class="label">Phishing risk reduction</div>
-                <div class="value">{int(round(roi['phish_reduction_pct']))}%</div>
-                <div class="sub">{tone} improvement potential</div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f"""
-            <div class="card">
-              <div class="kpi">
-                <div class="label">Annual avoided losses (estimate)</div>
-                <div class="value">{format_currency(roi['annual_avoided_loss'])}</div>
-                <div class="sub">Baseline incidents: {roi['annual_incidents_baseline']:.2f} / year</div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f"""
-            <div class="card">
-              <div class="kpi">
-                <div class="label">Investment affordability (cap)</div>
-                <div class="value">{format_currency(roi['affordability_cap_monthly'])} / mo</div>
-                <div class="sub">ROI &gt; 0 if monthly cost ≤ this</div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+        cards = (
+            kpi_card("Recommended plan", roi['plan'], [f"Why: {reasons}"], plan=True),
+            kpi_card("Monthly workload reduction", format_hours(roi['hours_saved']),
+                     [f"≈ {format_currency(roi['labor_savings_monthly'])} / month"]),
+            kpi_card("Phishing risk reduction", f"{int(round(roi['phish_reduction_pct']))}%",
+                     [f"{tone} improvement potential"]),
+            kpi_card("Annual avoided losses (estimate)", format_currency(roi['annual_avoided_loss']),
+                     [f"Baseline incidents: {roi['annual_incidents_baseline']:.2f} / year"]),
+            kpi_card("Investment affordability (cap)", f"{format_currency(roi['affordability_cap_monthly'])} / mo",
+                     ["ROI &gt; 0 if monthly cost ≤ this"]),
+            kpi_card("Inputs snapshot (from last “Go”)", None, [
+                f"Industry: {roi['industry']}",
+                f"Staff: {roi['staff']} • IT FTE: {roi['it_staff']}",
+                f"Level: {roi['level']} • HIPAA: {roi['hipaa']}",
+                f"Devices: {roi['devices']} • Hourly: {format_currency(roi['hourly'])}",
+            ]),
         )
-        st.markdown(
-            f"""
-            <div class="card">
-              <div class="kpi">
-                <div class="label">Inputs snapshot (from last “Go”)</div>
-                <div class="sub">Industry: {roi['industry']}</div>
-                <div class="sub">Staff: {roi['staff']} • IT FTE: {roi['it_staff']}</div>
-                <div class="sub">Level: {roi['level']} • HIPAA: {roi['hipaa']}</div>
-                <div class="sub">Devices: {roi['devices']} • Hourly: {format_currency(roi['hourly'])}</div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.html("".join(cards))
 
     # ---- Column 2: Similar organizations ----
     with col_cases:
         st.markdown("### Similar organizations that succeeded (Healthcare SMB)")
 
         def case_card(title, before, after, link="#"):
-            st.markdown(
-                f"""
-                <div class="card">
-                  <div class="kpi">
-                    <div class="label">{title}</div>
-                    <div class="sub"><strong>Before:</strong> {before}</div>
-                    <div class="sub"><strong>After:</strong> {after}</div>
-                    <div class="sub"><a class="link" href="{link}">View details →</a></div>
-                  </div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-
-        case_card(
-            "Community Health Clinic (45 staff)",
-            "Ad-hoc patching, HIPAA anxiety, frequent phishing clicks.",
-            "Monthly reports, visible HIPAA posture, 24 h/mo workload reduction."
-        )
-        case_card(
-            "Non-profit Rehab Center (80 staff)",
-            "No dedicated IT; endpoint sprawl.",
-            "Standard plan; 28% phishing reduction; $36k/yr loss avoidance."
-        )
-        case_card(
-            "Dental Network (120 staff)",
-            "Mixed vendors, limited MFA coverage.",
-            "Advanced plan; 18 h/mo saved in ops; predictable compliance cadence."
-        )
+            return kpi_card(title, None, [
+                f"<strong>Before:</strong> {before}",
+                f"<strong>After:</strong> {after}",
+                f'<a class="link" href="{link}">View details →</a>',
+            ])
+
+        st.html("".join((
+            case_card(
+                "Community Health Clinic (45 staff)",
+                "Ad-hoc patching, HIPAA anxiety, frequent phishing clicks.",
+                "Monthly reports, visible HIPAA posture, 24 h/mo workload reduction."
+            ),
+            case_card(
+                "Non-profit Rehab Center (80 staff)",
+                "No dedicated IT; endpoint sprawl.",
+                "Standard plan; 28% phishing reduction; $36k/yr loss avoidance."
+            ),
+            case_card(
+                "Dental Network (120 staff)",
+                "Mixed vendors, limited MFA coverage.",
+                "Advanced plan; 18 h/mo saved in ops; predictable compliance cadence."
+            ),
+        )))
 
     # ---- Column 3: Next steps ----
     with col_next:
         st.markdown("### Next steps")
 
-        # Save as PDF
+        # Save as PDF (runs in an iframe: markdown/st.html strip javascript: links and onclick,
+        # so print the parent page rather than the iframe's own document)
         components.html(
             """
             <div class="actions">
-              <button class="btn btn-primary" onclick="window.print()">Save as PDF</button>
+              <button class="btn btn-primary" onclick="window.parent.print()">Save as PDF</button>
             </div>
             """,
             height=50,
         )
 
         # Email CTA
-        email_to = "contact@digitalbunker365.com"  # change to production alias if needed
-        subject = "ROI Quick Check — Request detailed report"
-        body_lines = [
-            "Hi Digital Bunker 365 team,",
-            "",
-            "Please send me a detailed ROI report based on my quick check.",
-            "",
-            f"Industry: {roi['industry']}",
-            f"Staff: {roi['staff']}, IT FTE: {roi['it_staff']}, Devices: {roi['devices']}",
-            f"Current level: {roi['level']}, HIPAA: {roi['hipaa']}",
-            f"Monthly workload reduction: {format_hours(roi['hours_saved'])} (≈ {format_currency(roi['labor_savings_monthly'])}/mo)",
-            f"Phishing risk reduction: {int(round(roi['phish_reduction_pct']))}%",
-            f"Annual avoided losses: {format_currency(roi['annual_avoided_loss'])}",
-            f"Affordability cap (monthly): {format_currency(roi['affordability_cap_monthly'])}",
-            "",
-            "Thanks!"
-        ]
-        body = urllib.parse.quote("\n".join(body_lines))
-        subject_q = urllib.parse.quote(subject)
-        mailto_url = f"mailto:{email_to}?subject={subject_q}&body={body}"
+        body = urllib.parse.quote(MAILTO_BODY_TMPL.format_map({
+            **roi,
+            "hours_fmt": format_hours(roi['hours_saved']),
+            "labor_fmt": format_currency(roi['labor_savings_monthly']),
+            "phish_pct": int(round(roi['phish_reduction_pct'])),
+            "avoided_fmt": format_currency(roi['annual_avoided_loss']),
+            "cap_fmt": format_currency(roi['affordability_cap_monthly']),
+        }))
+        mailto_url = f"mailto:{MAILTO_TO}?subject={MAILTO_SUBJECT_Q}&body={body}"
         st.markdown(f'<a class="btn" href="{mailto_url}">Email me a detailed report</a>', unsafe_allow_html=True)
 
         st.caption("Tip: Adjust inputs above and press **Go** again to refresh results.")
 
+    # ---- Sensitivity: cap across headcount (same inputs otherwise) ----
+    with st.expander("How the affordability cap scales with headcount"):
+        # Your device ratio, so the curve passes through the cap shown above at your headcount
+        devices_per_staff = roi['devices'] / roi['staff']
+        st.line_chart(cap_by_headcount(roi['it_staff'], roi['level'], roi['hourly'], devices_per_staff,
+                                       max_staff=max(500, 2 * roi['staff'])),
+                      x="Staff", y="Cap ($/mo)")
+        st.caption(f"Devices scale with headcount at your current ratio ({devices_per_staff:.2f} per staff).")
+
     # ---------------------------
     # Assumptions at the very bottom (below the three columns)
     # ---------------------------
@@ -413,32 +445,15 @@ if roi:
     # NEW: anchor target placed just above the expander
     st.markdown('<div id="assumptions" class="anchor-offset"></div>', unsafe_allow_html=True)
     with st.expander("Assumptions, formulas & limitations (please read)"):
-        st.markdown(
-            f"""
-- **Estimates only.** Results are a directional guide for budgeting and value visualization.
-- **We do not store inputs.** This prototype does not persist your data.
-- **Formulas (prototype-grade):**
-  - Current monthly ops hours = `0.4 × staff + 8 × IT_FTE + 0.03 × devices` (min 12 h).
-  - Workload reduction rate by current level: **Minimum 35%**, **Standard 25%**, **Advanced 15%**.
-  - Phishing incident reduction potential by current level: **Minimum 30%**, **Standard 22%**, **Advanced 15%**.
-  - Annual incidents baseline (pre-solution) = `staff / {{120, 180, 260}}` for levels {{Minimum, Standard, Advanced}}, clamped to **[0.2, 8]**.
-  - **Annual avoided losses** = `baseline incidents × ${int(LOSS_PER_INCIDENT):,} × reduction rate`.
-  - **Affordability cap (monthly)** = `labor savings per month + (annual avoided losses / 12)`.
-- **Plan recommendation heuristic (prototype):** weighs HIPAA need, size, IT coverage, current controls, and device density to suggest **Essential / Standard / Advanced**.
-- **HIPAA/BAA:** Indication is for messaging; full compliance depends on your implementation, agreements, and controls.
-- **Branding:** This is a prototype for **DigitalBunker365.com** and is not a public price quote.
-            """
-        )
+        st.markdown(ASSUMPTIONS_MD)
 
 # ---------------------------
 # Footer
 # ---------------------------
-st.markdown(
-    """
+FOOTER_TMPL = """
     <div class="footer-note">
       © {year} <a class="link" href="https://www.digitalbunker365.com/" target="_blank" rel="noopener">Digital Bunker 365</a> — Prototype for value visualization without public pricing.
     </div>
-    """.format(year=datetime.now().year),
-    unsafe_allow_html=True,
-)
+    """
 
+st.markdown(FOOTER_TMPL.format(year=datetime.now().year), unsafe_allow_html=True)